@@ -1,22 +1,258 @@
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import chain
+
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from jinja2 import Template
+
+# plotly and jinja2 are imported where they are used, so table/text-only
+# workflows don't pay their import cost
+
+# HTML Template embedded directly in the script
+_BASE_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <link href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css" rel="stylesheet">
+    <link href="https://cdn.datatables.net/1.13.4/css/dataTables.bootstrap4.min.css" rel="stylesheet">
+    <link href="https://cdn.jsdelivr.net/npm/tailwindcss@^2/dist/tailwind.min.css" rel="stylesheet">
+</head>
+<body>
+    <div class="container mx-auto p-4">
+        <h1 class="text-3xl font-bold mb-4">{{ title }}</h1>
+        {{ content|safe }}
+    </div>
+
+    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
+    <script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
+    {% if plotlyjs_src %}<script charset="utf-8" src="{{ plotlyjs_src }}"></script>{% endif %}
+    <script>
+        $(document).ready(function() {
+            // Each plot div is filled from its JSON payload; plotly.js is loaded once above
+            $('.plotly-graph-div').each(function() {
+                var div = this;
+                var fig = JSON.parse(document.getElementById(div.id + '-data').textContent);
+                var plot = Plotly.newPlot(div, fig.data, fig.layout, {"responsive": true});
+                // Animated figures: add the frames and start playback, as fig.to_html does
+                if (fig.frames) {
+                    plot.then(function() {
+                        return Plotly.addFrames(div, fig.frames);
+                    }).then(function() {
+                        Plotly.animate(div, null);
+                    });
+                }
+            });
+
+            $('table').each(function() {
+                var options = {
+                    "pagingType": "simple_numbers",
+                    "lengthMenu": [10, 25, 50, 75, 100],
+                    "pageLength": 10,
+                    "responsive": true,
+                    "autoWidth": false,
+                    "searching": true,
+                    "ordering": true,
+                    "info": true,
+                    "language": {
+                        "search": "Search:",
+                        "lengthMenu": "Show _MENU_ entries",
+                        "info": "Showing _START_ to _END_ of _TOTAL_ entries",
+                        "paginate": {
+                            "first": "First",
+                            "last": "Last",
+                            "next": "Next",
+                            "previous": "Previous"
+                        }
+                    }
+                };
+
+                // Table rows are shipped as JSON and built client-side
+                var payload = document.getElementById(this.id + '-data');
+                if (payload) {
+                    var table = JSON.parse(payload.textContent);
+                    var escape = $(this).data('escape') !== false;
+                    options.data = table.data;
+                    options.columns = table.columns.map(function(name, i) {
+                        // DataTables inserts titles and default content as HTML, so escape both;
+                        // missing values show as NaN / <NA> like to_html rendered them
+                        var column = {
+                            "title": $('<div>').text(String(name)).html(),
+                            "defaultContent": $('<div>').text(table.missing[i]).html()
+                        };
+                        if (escape) {
+                            column.render = $.fn.dataTable.render.text();
+                        }
+                        return column;
+                    });
+                }
+                $(this).DataTable(options);
+            });
+        });
+    </script>
+</body>
+</html>
+"""
+
+# Placeholders rendered into the template so the constant markup around them can be cached
+_TITLE_SENTINEL = '__ADASH_TITLE__'
+_CONTENT_SENTINEL = '__ADASH_CONTENT__'
+
+@lru_cache(maxsize=None)
+def _dashboard_parts(plotlyjs_src):
+    # Render the template once per plotly.js source and split it around the content;
+    # render_dashboard then only has to fill in the title and concatenate
+    from jinja2 import Environment
+    template = Environment(autoescape=False).from_string(_BASE_HTML_TEMPLATE)
+    html = template.render(title=_TITLE_SENTINEL, content=_CONTENT_SENTINEL, plotlyjs_src=plotlyjs_src)
+    head, foot = html.split(_CONTENT_SENTINEL)
+    return head, foot
+
+@lru_cache(maxsize=None)
+def _plotlyjs_src():
+    # Same plotly.js build that fig.to_html(include_plotlyjs='cdn') would reference
+    from plotly.offline import get_plotlyjs_version
+    return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+# pyarrow is optional; pandas imports it on demand when the engine is selected
+_HAS_PYARROW = find_spec('pyarrow') is not None
+
+def _read_html_table(source):
+    # Pin the lxml parser (required for HTML input) so pandas never falls back to bs4/html5lib
+    return pd.read_html(source, flavor='lxml')[0]
+
+def _object_display(value):
+    # How to_html renders a single object cell; dicts and lists as their repr, not JSON
+    if value is None:
+        return 'None'
+    if value is pd.NA:
+        return '<NA>'
+    if isinstance(value, float) and np.isnan(value):
+        return 'NaN'
+    return str(value)
+
+def _format_display_columns(df):
+    # Show dates and durations as to_html did ('2023-01-01', '1 days') instead of to_json's
+    # epoch milliseconds or ISO timestamps, and object cells as to_html's strings
+    formatted = None
+    for col, dtype in df.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype):
+            values = df[col].astype(str).fillna('NaT')
+        elif pd.api.types.is_object_dtype(dtype):
+            values = df[col].map(_object_display)
+        else:
+            continue
+        if formatted is None:
+            formatted = df.copy(deep=False)
+        formatted[col] = values
+    return df if formatted is None else formatted
+
+def _missing_label(dtype):
+    # What to_html printed for a missing value in a column of this dtype
+    return '<NA>' if getattr(dtype, 'na_value', None) is pd.NA else 'NaN'
+
+# graph_objects trace, its options and the y label prefix for each supported plot_type,
+# mirroring the equivalent plotly.express call for a single x/y pair
+_PLOT_TRACES = {
+    'line': ('Scatter', {'mode': 'lines'}, ''),
+    'bar': ('Bar', {}, ''),
+    'scatter': ('Scatter', {'mode': 'markers'}, ''),
+    'histogram': ('Histogram', {'histfunc': 'sum'}, 'sum of '),
+}
+
+def _build_fig(plot_type, x, y, x_name, y_name, title=None):
+    # Build the trace directly instead of going through plotly.express' DataFrame handling,
+    # keeping the labels, hover text and top margin px would have set
+    import plotly.graph_objects as go
+    trace_name, trace_kw, y_prefix = _PLOT_TRACES[plot_type]
+    x_label, y_label = str(x_name), f"{y_prefix}{y_name}"
+    hovertemplate = f"{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>"
+    trace = getattr(go, trace_name)(x=x, y=y, hovertemplate=hovertemplate, **trace_kw)
+
+    # Pass the layout with the figure so Plotly validates it once
+    # Like px, untitled figures get a 60px top margin and titled ones keep Plotly's default
+    layout = {'xaxis_title_text': x_label, 'yaxis_title_text': y_label}
+    if title is not None:
+        layout['title_text'] = title
+    else:
+        layout['margin_t'] = 60
+    return go.Figure(data=[trace], layout=layout)
+
+# Serialized figures for calls that pass a cache_key, shared by all dashboards,
+# least recently used first
+_PLOT_JSON_CACHE = OrderedDict()
+_PLOT_JSON_CACHE_SIZE = 128
+
+def _cached_plot_json(key, serialize):
+    # Return the cached JSON for key, calling serialize() only on a miss
+    plot_json = _PLOT_JSON_CACHE.get(key)
+    if plot_json is not None:
+        _PLOT_JSON_CACHE.move_to_end(key)
+        return plot_json
+    plot_json = serialize()
+    _PLOT_JSON_CACHE[key] = plot_json
+    if len(_PLOT_JSON_CACHE) > _PLOT_JSON_CACHE_SIZE:
+        _PLOT_JSON_CACHE.popitem(last=False)
+    return plot_json
+
+def clear_plot_cache():
+    # Drop every serialized figure kept for cache_key reuse
+    _PLOT_JSON_CACHE.clear()
+
+# Tailwind alignment classes; anything not listed falls back to 'text-center'
+_TEXT_POSITIONS = {
+    'left': 'text-left',
+    'right': 'text-right',
+    'justify': 'text-justify',
+    'start': 'text-start',
+    'end': 'text-end',
+}
+_TITLE_POSITIONS = {
+    'left': 'text-left',
+    'right': 'text-right',
+}
+
+# Opening tags for adash_text lists, filled in with the position class
+_OL_OPEN = "<ol class='mt-2 list-decimal list-inside {pos}'>"
+_UL_OPEN = "<ul class='mt-2 list-disc list-inside {pos}'>"
 
 class Adash:
+    __slots__ = ('data', 'layout_config', 'plots_html', 'tables_html', 'texts_html')
+    
     def __init__(self):
         self.data = None
         self.layout_config = None
+        # Queued content: plots and tables hold dicts with their JSON payloads (rendered
+        # into markup by render_dashboard), texts hold ready HTML fragments
         self.plots_html = []
         self.tables_html = []
         self.texts_html = []
     
-    def input_file(self, data, file_type='df'):
+    def input_file(self, data, file_type='df', chunksize=None, engine=None):
         if file_type == 'df':
             self.data = data
         elif file_type == 'csv':
-            self.data = pd.read_csv(data)
+            if engine == 'pyarrow' and chunksize is not None:
+                raise ValueError("The 'pyarrow' engine does not support chunksize. Use engine='c' or 'python' to read in chunks.")
+            # Arrow-backed dtypes whenever pyarrow reads the file or would have been picked,
+            # so passing chunksize doesn't change the dtypes of self.data
+            use_arrow = engine == 'pyarrow' or (engine is None and _HAS_PYARROW)
+            read_kw = {'dtype_backend': 'pyarrow'} if use_arrow else {}
+            if chunksize is None:
+                # Prefer pyarrow's multithreaded reader when it is installed
+                if use_arrow:
+                    engine = 'pyarrow'
+                self.data = pd.read_csv(data, engine=engine, **read_kw)
+            else:
+                # Stream the file in chunks to bound peak memory
+                chunks = pd.read_csv(data, engine=engine, chunksize=chunksize, **read_kw)
+                self.data = pd.concat(chunks, ignore_index=True)
         elif file_type == 'html':
-            self.data = pd.read_html(data)[0]
+            self.data = _read_html_table(data)
         else:
             raise ValueError("Unsupported file type. Please use 'df', 'csv', or 'html'.")
     
@@ -25,189 +261,162 @@ class Adash:
             'rows': [{'columns': [{'type': 'plot', 'index': i} for i in range(col)]} for row, col in enumerate(layout_array)]
         }
     
-    def adash_plot(self, fig=None, plot_type='line', title=None, position='center'):
+    def adash_plot(self, fig=None, plot_type='line', title=None, position='center', cache_key=None):
         if self.data is None and fig is None:
             raise ValueError("No data or figure provided. Please input data or pass a Plotly figure.")
         
         if fig is not None:
-            # Use provided fig object
-            plot_html = fig.to_html(full_html=False, include_plotlyjs='cdn')
-            self.plots_html.append({'html': plot_html, 'title': title, 'position': position})
+            # Use provided fig object; reuse an earlier serialization if the caller keyed it
+            if cache_key is None:
+                plot_json = self._fig_to_json(fig)
+            else:
+                plot_json = _cached_plot_json(('fig', cache_key), lambda: self._fig_to_json(fig))
+            self.plots_html.append({'json': plot_json, 'title': title, 'position': position})
         else:
             # Generate plot based on plot_type
-            for i, row_config in enumerate(self.layout_config['rows']):
-                for col_config in row_config['columns']:
-                    if plot_type == 'line':
-                        fig = px.line(self.data, x=self.data.columns[0], y=self.data.columns[1])
-                    elif plot_type == 'bar':
-                        fig = px.bar(self.data, x=self.data.columns[0], y=self.data.columns[1])
-                    elif plot_type == 'scatter':
-                        fig = px.scatter(self.data, x=self.data.columns[0], y=self.data.columns[1])
-                    elif plot_type == 'histogram':
-                        fig = px.histogram(self.data, x=self.data.columns[0], y=self.data.columns[1])
-                    else:
-                        raise ValueError("Unsupported plot type. Please use 'line', 'bar', 'scatter', or 'histogram'.")
-
-                    # Add user-defined title if provided
-                    if title is not None:
-                        fig.update_layout(title_text=title)
-                    
-                    plot_html = fig.to_html(full_html=False, include_plotlyjs='cdn')
-                    self.plots_html.append({'html': plot_html, 'title': title, 'position': position})
+            if plot_type not in _PLOT_TRACES:
+                raise ValueError("Unsupported plot type. Please use 'line', 'bar', 'scatter', or 'histogram'.")
+
+            cols = self.data.columns
+            x_col, y_col = cols[0], cols[1]
+
+            # Every layout cell shows the same figure, so build it once
+            def serialize():
+                x = self.data.iloc[:, 0].to_numpy()
+                y = self.data.iloc[:, 1].to_numpy()
+                return self._fig_to_json(_build_fig(plot_type, x, y, x_col, y_col, title))
+
+            # Div ids are assigned at render time, so every cell can share one payload.
+            # A caller-supplied cache_key names the data, so repeated calls skip the rebuild
+            if cache_key is None:
+                plot_json = serialize()
+            else:
+                key = ('generated', cache_key, plot_type, title, str(x_col), str(y_col))
+                plot_json = _cached_plot_json(key, serialize)
+            total_cells = sum(len(row_config['columns']) for row_config in self.layout_config['rows'])
+            for _ in range(total_cells):
+                self.plots_html.append({'json': plot_json, 'title': title, 'position': position})
+    
+    def adash_plots(self, figs, titles=None, positions=None):
+        figs = list(figs)
+        titles = [None] * len(figs) if titles is None else list(titles)
+        positions = ['center'] * len(figs) if positions is None else list(positions)
+        if not len(figs) == len(titles) == len(positions):
+            raise ValueError("figs, titles and positions must have the same length.")
+        
+        # Serialized one after another: pio.to_json holds the GIL throughout, so threads don't help
+        for fig, title, position in zip(figs, titles, positions):
+            self.plots_html.append({'json': self._fig_to_json(fig), 'title': title, 'position': position})
     
     def adash_table(self, data=None):
         if data is not None:
             if isinstance(data, pd.DataFrame):
-                self.tables_html.append(data.to_html(classes='display', index=False))
+                self.tables_html.append(self._table_payload(data))
             elif isinstance(data, str):
                 if data.endswith('.csv'):
                     df = pd.read_csv(data)
-                    self.tables_html.append(df.to_html(classes='display', index=False))
+                    self.tables_html.append(self._table_payload(df))
                 elif data.endswith('.html'):
-                    df = pd.read_html(data)[0]
-                    self.tables_html.append(df.to_html(classes='display', index=False))
+                    df = _read_html_table(data)
+                    self.tables_html.append(self._table_payload(df))
                 else:
                     raise ValueError("Unsupported file format. Please use a DataFrame, CSV, or HTML file.")
         else:
             if self.data is not None:
-                table_html = self.data.to_html(classes='display', index=False)
-                self.tables_html.append(table_html)
+                self.tables_html.append(self._table_payload(self.data))
             else:
                 raise ValueError("No data available. Please input data first.")
 
     def adash_text(self, heading=None, textlines=None, ordered_list=None, unordered_list=None, position='center'):
         position_class = self._get_text_position_class(position)
-        text_html = ''
+        parts = []
         
         if heading:
-            text_html += f"<h2 class='text-2xl font-bold {position_class}'>{heading}</h2>"
+            parts.append(f"<h2 class='text-2xl font-bold {position_class}'>{heading}</h2>")
         
         if textlines:
-            for line in textlines:
-                text_html += f"<p class='mt-2 {position_class}'>{line}</p>"
+            parts.extend(f"<p class='mt-2 {position_class}'>{line}</p>" for line in textlines)
         
         if ordered_list:
-            text_html += "<ol class='mt-2 list-decimal list-inside {position_class}'>"
-            for item in ordered_list:
-                text_html += f"<li>{item}</li>"
-            text_html += "</ol>"
+            parts.append(_OL_OPEN.format(pos=position_class))
+            parts.extend(f"<li>{item}</li>" for item in ordered_list)
+            parts.append("</ol>")
         
         if unordered_list:
-            text_html += "<ul class='mt-2 list-disc list-inside {position_class}'>"
-            for item in unordered_list:
-                text_html += f"<li>{item}</li>"
-            text_html += "</ul>"
+            parts.append(_UL_OPEN.format(pos=position_class))
+            parts.extend(f"<li>{item}</li>" for item in unordered_list)
+            parts.append("</ul>")
         
-        self.texts_html.append(text_html)
+        self.texts_html.append(''.join(parts))
     
     def render_dashboard(self, title='Adash Dashboard'):
-        # Render tables first
-        tables_content = '\n'.join(self.tables_html)
-        
-        # Render text content
-        texts_content = '\n'.join(self.texts_html)
+        # Render tables first, as empty shells filled from their JSON payload
+        table_parts = [
+            f"<table id='table-{i}' class='display' data-escape='{str(table['escape']).lower()}'></table>\n"
+            f"<script type='application/json' id='table-{i}-data'>{table['payload']}</script>"
+            for i, table in enumerate(self.tables_html)
+        ]
         
         # Render plots and handle title positioning
-        plots_content = ''
-        for plot in self.plots_html:
-            title_html = ''
+        plot_parts = []
+        for i, plot in enumerate(self.plots_html):
             if plot['title']:
-                title_html = f"<h3 class='text-xl font-semibold {self._get_title_position_class(plot['position'])}'>{plot['title']}</h3>"
+                plot_parts.append(f"<h3 class='text-xl font-semibold {self._get_title_position_class(plot['position'])}'>{plot['title']}</h3>")
 
-            plots_content += f"{title_html}\n{plot['html']}\n"
-        
-        # Combine all contents in the desired order
-        content_html = tables_content + texts_content + plots_content
-        
-        # HTML Template embedded directly in the script
-        base_html_template = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{{ title }}</title>
-            <link href="https://cdn.datatables.net/1.13.4/css/jquery.dataTables.min.css" rel="stylesheet">
-            <link href="https://cdn.datatables.net/1.13.4/css/dataTables.bootstrap4.min.css" rel="stylesheet">
-            <link href="https://cdn.jsdelivr.net/npm/tailwindcss@^2/dist/tailwind.min.css" rel="stylesheet">
-        </head>
-        <body>
-            <div class="container mx-auto p-4">
-                <h1 class="text-3xl font-bold mb-4">{{ title }}</h1>
-                {{ content|safe }}
-            </div>
-
-            <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
-            <script src="https://cdn.datatables.net/1.13.4/js/jquery.dataTables.min.js"></script>
-            <script>
-                $(document).ready(function() {
-                    $('table').DataTable({
-                        "pagingType": "simple_numbers",
-                        "lengthMenu": [10, 25, 50, 75, 100],
-                        "pageLength": 10,
-                        "responsive": true,
-                        "autoWidth": false,
-                        "searching": true,
-                        "ordering": true,
-                        "info": true,
-                        "language": {
-                            "search": "Search:",
-                            "lengthMenu": "Show _MENU_ entries",
-                            "info": "Showing _START_ to _END_ of _TOTAL_ entries",
-                            "paginate": {
-                                "first": "First",
-                                "last": "Last",
-                                "next": "Next",
-                                "previous": "Previous"
-                            }
-                        }
-                    });
-                });
-            </script>
-        </body>
-        </html>
-        """
+            plot_parts.append(f"<div id='plot-{i}' class='plotly-graph-div' style='height:100%; width:100%;'></div>")
+            plot_parts.append(f"<script type='application/json' id='plot-{i}-data'>{plot['json']}</script>")
         
-        template = Template(base_html_template)
-        html_content = template.render(title=title, content=content_html)
+        # Combine all contents in the desired order (tables, text, plots) in one pass
+        content_html = '\n'.join(chain(table_parts, self.texts_html, plot_parts))
         
-        return html_content
+        # plotly.js is only needed when there is something to plot
+        plotlyjs_src = _plotlyjs_src() if self.plots_html else None
+        head, foot = _dashboard_parts(plotlyjs_src)
+        return ''.join((head.replace(_TITLE_SENTINEL, str(title)), content_html, foot))
+    
+    def _fig_to_json(self, fig):
+        # plotly picks orjson when it is installed; the figure was validated on construction
+        import plotly.io as pio
+        return pio.to_json(fig, validate=False)
+    
+    def _table_payload(self, df):
+        # Only the data is serialized here; DataTables renders (and escapes) the rows.
+        # Numbers can't carry markup, so all-numeric frames skip the per-cell escaping;
+        # anything with text columns keeps it, since cell values end up as HTML.
+        escape = not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+        missing = [_missing_label(dtype) for dtype in df.dtypes]
+        df = _format_display_columns(df)
+        # Append each column's missing-value label to the split payload
+        payload = df.to_json(orient='split', index=False)
+        payload = payload[:-1] + ',"missing":' + json.dumps(missing, separators=(',', ':')) + '}'
+        # pandas only escapes '/', so keep '<' and '>' from closing or re-opening the script block
+        payload = payload.replace('<', '\\u003c').replace('>', '\\u003e')
+        return {'payload': payload, 'escape': escape}
     
     def _get_text_position_class(self, position):
-        if position == 'left':
-            return 'text-left'
-        elif position == 'right':
-            return 'text-right'
-        elif position == 'justify':
-            return 'text-justify'
-        elif position == 'start':
-            return 'text-start'
-        elif position == 'end':
-            return 'text-end'
-        else:
-            return 'text-center'
+        return _TEXT_POSITIONS.get(position, 'text-center')
     
     def _get_title_position_class(self, position):
-        if position == 'left':
-            return 'text-left'
-        elif position == 'right':
-            return 'text-right'
-        else:
-            return 'text-center'
+        return _TITLE_POSITIONS.get(position, 'text-center')
     
     def save_dashboard(self, output_file):
-        html_content = self.render_dashboard()
-        with open(output_file, 'w') as f:
-            f.write(html_content)
+        # Encode once and hand the whole page to a single large buffered write
+        data = self.render_dashboard().encode('utf-8')
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(data)
         print(f"Dashboard saved to {output_file}")
 
 # Example of using the updated Adash library
 if __name__ == "__main__":
+    import plotly.express as px
+
+    n = 100
+    idx = np.arange(n)
     df = pd.DataFrame({
-        'Date': pd.date_range(start='2023-01-01', periods=100, freq='D'),
-        'Value': [i * 10 for i in range(100)],
-        'Category': ['Category 1' if i % 2 == 0 else 'Category 2' for i in range(100)],
-        'Details': ['Detail A' if i % 3 == 0 else 'Detail B' for i in range(100)]
+        'Date': pd.date_range(start='2023-01-01', periods=n, freq='D'),
+        'Value': idx * 10,
+        'Category': pd.Categorical(np.where(idx % 2 == 0, 'Category 1', 'Category 2')),
+        'Details': pd.Categorical(np.where(idx % 3 == 0, 'Detail A', 'Detail B'))
     })
     
     adash = Adash()